@@ -1,30 +1,225 @@
 # Импорт необходимых библиотек
-import pandas as pd          # Для работы с табличными данными
+try:
+    # FireDucks - совместимая с pandas библиотека с многопоточным
+    # чтением CSV и группировками; используется, если установлена
+    import fireducks.pandas as pd
+except ImportError:
+    import pandas as pd      # Для работы с табличными данными
 import numpy as np           # Для математических операций
-import matplotlib.pyplot as plt  # Для построения графиков
-import seaborn as sns        # Для статистической визуализации
 import logging               # Для логирования работы программы
+import os                    # Для переменных окружения
+import sys                   # Для определения платформы
+
+try:
+    # Numba компилирует расчет квантилей по группам в машинный код;
+    # без нее используется обычная группировка pandas
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # Настройка логирования: вывод информационных сообщений в консоль
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+# Квантили для boxplot: минимум, квартили, медиана, максимум
+QUARTILES = (0, 0.25, 0.5, 0.75, 1)
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _group_quantiles_kernel(codes, values, n_groups, quantiles):
+        """
+        Квантили значений по группам, заданным целочисленными кодами.
+        Значения раскладываются по группам сортировкой подсчетом,
+        затем каждая группа сортируется параллельно.
+        
+        Аргументы:
+            codes (ndarray): Коды групп от 0 до n_groups - 1
+            values (ndarray): Значения той же длины
+            n_groups (int): Количество групп
+            quantiles (ndarray): Уровни квантилей от 0 до 1
+        
+        Возвращает:
+            ndarray: Матрица n_groups x len(quantiles); NaN для пустых групп
+        """
+        # Границы групп в общем буфере
+        offsets = np.zeros(n_groups + 1, np.int64)
+        for i in range(codes.shape[0]):
+            offsets[codes[i] + 1] += 1
+        offsets = np.cumsum(offsets)
+        
+        # Раскладываем значения по группам
+        positions = offsets[:-1].copy()
+        buckets = np.empty(values.shape[0], values.dtype)
+        for i in range(codes.shape[0]):
+            group = codes[i]
+            buckets[positions[group]] = values[i]
+            positions[group] += 1
+        
+        # Квантили с линейной интерполяцией, как в pandas
+        result = np.full((n_groups, quantiles.shape[0]), np.nan)
+        for group in prange(n_groups):
+            start = offsets[group]
+            size = offsets[group + 1] - start
+            if size == 0:
+                continue
+            ordered = np.sort(buckets[start:start + size])
+            for j in range(quantiles.shape[0]):
+                position = quantiles[j] * (size - 1)
+                lower = int(np.floor(position))
+                upper = min(lower + 1, size - 1)
+                result[group, j] = ordered[lower] + \
+                    (ordered[upper] - ordered[lower]) * (position - lower)
+        return result
+
+
+def _group_quantiles(keys, values, quantiles):
+    """
+    Квантили значений по категориальному ключу.
+    
+    Аргументы:
+        keys (pd.Series): Категориальная колонка для группировки
+        values (pd.Series): Числовая колонка
+        quantiles (tuple): Уровни квантилей от 0 до 1
+    
+    Возвращает:
+        pd.DataFrame: Строки - группы (по алфавиту), колонки - квантили
+    """
+    if not HAS_NUMBA or keys.dtype != 'category':
+        return values.groupby(keys, observed=True, sort=False) \
+                     .quantile(list(quantiles)) \
+                     .unstack() \
+                     .sort_index()
+    
+    # Пропуски в ключе имеют код -1 и не входят ни в одну группу
+    codes = keys.cat.codes.to_numpy()
+    mask = codes >= 0
+    result = _group_quantiles_kernel(
+        codes[mask],
+        values.to_numpy(np.float32)[mask],
+        len(keys.cat.categories),
+        np.asarray(quantiles, dtype=np.float64)
+    )
+    index = pd.Index(keys.cat.categories, name=keys.name)
+    return pd.DataFrame(result, index=index, columns=list(quantiles)) \
+             .dropna(how='all') \
+             .sort_index()
+
 
 class FashionAnalyzer:
     """
     Класс для анализа данных о зимних модных трендах.
     Выполняет загрузку, очистку, анализ и визуализацию
     """
+
+    # Строковые колонки с небольшим числом уникальных значений,
+    # которые хранятся как category для быстрых группировок
+    CATEGORY_COLUMNS = ('Color', 'Brand', 'Style', 'Season', 'Category')
+
+    # Числовые колонки, которые используются в статистике и графиках
+    NUMERIC_COLUMNS = ('Price(USD)', 'Popularity_Score', 'Customer_Rating')
+
+    # Уникальный номер записи: нужен только для поиска дубликатов
+    ID_COLUMN = 'ID'
     
-    def __init__(self, filename):
+    def __init__(self, filename, chunksize=None, use_cache=True):
         """
         Инициализация анализатора.
         
         Аргументы:
             filename (str): Путь к CSV с данными
+            chunksize (int): Размер части (в строках) для потокового
+                             чтения больших CSV; None - читать целиком
+            use_cache (bool): Сохранять очищенные данные в Parquet рядом
+                              с CSV и читать их оттуда при следующих запусках
         """
         self.filename = filename  # Сохраняем имя файла
+        self.chunksize = chunksize  # Сохраняем размер части
+        self.use_cache = use_cache  # Использовать ли кэш Parquet
+        self.cache_path = filename + '.parquet'  # Путь к кэшу
         self.df = None           # Инициализируем DataFrame как None
     
+    def _read_chunks(self, usecols, dtype):
+        """
+        Чтение CSV-файла частями по self.chunksize строк.
+        Каждая часть сразу хранится в компактных типах без дубликатов
+        внутри части. Пиковая память при склейке - примерно два объема
+        очищенных данных: медиана и квантили требуют колонки целиком,
+        поэтому сами данные все равно собираются в один DataFrame.
+        
+        Аргументы:
+            usecols (list): Читаемые колонки
+            dtype (dict): Типы колонок
+        
+        Возвращает:
+            pd.DataFrame: Склеенные части
+        """
+        chunks = []
+        # Парсер pyarrow не поддерживает chunksize, поэтому здесь
+        # используется стандартный парсер pandas
+        for chunk in pd.read_csv(self.filename, chunksize=self.chunksize,
+                                 usecols=usecols, dtype=dtype):
+            # Дубликаты внутри части удаляем сразу, чтобы не копить их
+            chunks.append(chunk.drop_duplicates())
+        
+        # В файле только заголовок: возвращаем пустую таблицу нужных типов
+        if not chunks:
+            return pd.read_csv(self.filename, nrows=0, usecols=usecols, dtype=dtype)
+        
+        # У частей разные наборы категорий: приводим их к общему,
+        # иначе при склейке колонки превратятся в object
+        for column in self.CATEGORY_COLUMNS:
+            if column not in usecols:
+                continue
+            categories = pd.api.types.union_categoricals(
+                [chunk[column] for chunk in chunks], sort_categories=True
+            ).categories
+            for chunk in chunks:
+                chunk[column] = chunk[column].cat.set_categories(categories)
+        
+        return pd.concat(chunks, ignore_index=True)
+    
+    def _read_cache(self):
+        """
+        Чтение очищенных данных из кэша Parquet.
+        Кэш действителен, только если его время изменения совпадает
+        с временем изменения CSV-файла (оно переносится при записи).
+        
+        Возвращает:
+            bool: True если данные прочитаны из кэша
+        """
+        if not os.path.exists(self.cache_path):
+            return False
+        if os.stat(self.cache_path).st_mtime_ns != os.stat(self.filename).st_mtime_ns:
+            return False
+        try:
+            self.df = pd.read_parquet(self.cache_path)
+        except Exception as e:
+            # Поврежденный кэш не мешает анализу: читаем CSV заново
+            logging.warning(f"Не удалось прочитать кэш {self.cache_path}: {e}")
+            return False
+        logging.info("Данные загружены из кэша.")
+        return True
+    
+    def _write_cache(self):
+        """
+        Сохранение очищенных данных в кэш Parquet.
+        Запись идет во временный файл, который затем атомарно заменяет
+        кэш, поэтому прерванная запись не оставляет испорченный кэш.
+        Ошибка записи не мешает анализу.
+        """
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            self.df.to_parquet(temp_path, compression='zstd')
+            # Переносим время изменения CSV, чтобы по нему проверять кэш
+            source = os.stat(self.filename)
+            os.utime(temp_path, ns=(source.st_atime_ns, source.st_mtime_ns))
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            logging.warning(f"Не удалось сохранить кэш {self.cache_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
     def load_data(self):
         """
         Загрузка и очистка данных из CSV-файла.
@@ -33,13 +228,53 @@ class FashionAnalyzer:
             bool: True если данные успешно загружены, False в случае ошибки
         """
         try:
-            # Загружаем данные из CSV-файла
-            self.df = pd.read_csv(self.filename)
+            # Если кэш соответствует CSV-файлу, читаем уже очищенные данные из него
+            if self.use_cache and self._read_cache():
+                return True
+            
+            # Загружаем из CSV-файла только нужные колонки.
+            # Категориальные колонки сразу читаются как category:
+            # группировки идут по целочисленным кодам, а не по строкам.
+            # Числовые колонки читаются как float32 - точности
+            # достаточно, а объем данных для агрегаций вдвое меньше
+            # Колонки, которых нет в файле, пропускаем: соответствующие
+            # статистики и графики просто не строятся
+            header = set(pd.read_csv(self.filename, nrows=0).columns)
+            wanted = (self.ID_COLUMN,) + self.CATEGORY_COLUMNS + self.NUMERIC_COLUMNS
+            usecols = [column for column in wanted if column in header]
+            dtype = {column: 'category' for column in self.CATEGORY_COLUMNS
+                     if column in header}
+            dtype.update({column: 'float32' for column in self.NUMERIC_COLUMNS
+                          if column in header})
+            if self.chunksize:
+                self.df = self._read_chunks(usecols, dtype)
+            else:
+                self.df = pd.read_csv(
+                    self.filename,
+                    engine='pyarrow',     # Многопоточный парсер Arrow
+                    usecols=usecols,
+                    dtype=dtype
+                )
             
             # Очищаем данные:
-            # 1. Заменяем пропущенные значения на 0
-            # 2. Удаляем дублирующиеся строки
-            self.df = self.df.fillna(0).drop_duplicates()
+            # 1. Заменяем пропущенные значения на 0 в числовых колонках
+            # 2. Удаляем дублирующиеся строки. Дубликатом считается
+            #    повтор записи с тем же ID: разные записи могут совпадать
+            #    по всем анализируемым колонкам. Категориальные колонки
+            #    при этом хешируются по целочисленным кодам, а не по строкам
+            # 3. Убираем ID - в анализе он не участвует
+            numeric = self.df[[column for column in self.NUMERIC_COLUMNS if column in header]]
+            na_columns = numeric.columns[numeric.isna().any()].tolist()
+            if na_columns:
+                # Заполняем только колонки, где действительно есть пропуски
+                self.df[na_columns] = self.df[na_columns].fillna(0)
+            self.df.drop_duplicates(inplace=True, ignore_index=True)
+            if self.ID_COLUMN in header:
+                self.df.drop(columns=self.ID_COLUMN, inplace=True)
+            
+            # Сохраняем очищенные данные в кэш
+            if self.use_cache:
+                self._write_cache()
             
             # Логируем успешную загрузку
             logging.info("Данные загружены и очищены.")
@@ -63,126 +298,243 @@ class FashionAnalyzer:
         print(" ОСНОВНАЯ СТАТИСТИКА ")
         print("="*40)
         
-        # Выводим описательную статистику для числовых колонок
-        print(self.df.describe())
+        columns = set(self.df.columns)
         
-        # Если в данных есть колонка 'Popularity_Score',
+        # Выводим описательную статистику только для анализируемых
+        # числовых колонок и только те показатели, которые нужны.
+        # Данные хранятся во float32, поэтому округляем до сотых,
+        # чтобы в отчете не было хвостов вида 244.059998
+        numeric = [column for column in self.NUMERIC_COLUMNS if column in columns]
+        if numeric:
+            print(self.df[numeric].agg(['count', 'mean', 'std', 'min', 'max']).round(2))
+        
+        # Если в данных есть колонки 'Category' и 'Popularity_Score',
         # вычисляем и выводим медиану популярности по категориям
-        if 'Popularity_Score' in self.df.columns:
+        if {'Category', 'Popularity_Score'} <= columns:
             print("\n" + "-"*40)
             print("Медиана популярности по категориям:")
             print("-"*40)
             
-            # Группируем по категориям и считаем медиану популярности
-            popularity = self.df.groupby('Category')['Popularity_Score'] \
-                              .median() \
-                              .sort_values(ascending=False)
-            print(popularity)
+            # Медиана популярности по категориям; сортируется только
+            # маленький результат. С Numba медиана считается ядром
+            # квантилей (квантиль 0.5), без нее - группировкой pandas
+            category = self.df['Category']
+            if HAS_NUMBA and category.dtype == 'category':
+                medians = _group_quantiles(category, self.df['Popularity_Score'], (0.5,))
+                popularity = medians[0.5].rename('Popularity_Score')
+            else:
+                popularity = self.df.groupby('Category', observed=True, sort=False)['Popularity_Score'] \
+                                 .median()
+            popularity = popularity.sort_values(ascending=False)
+            print(popularity.round(2))
+
+    def _plot_aggregates(self):
+        """
+        Предварительный расчет всех агрегатов для графиков.
+        Графики строятся по небольшим готовым таблицам, а не
+        сканируют DataFrame каждый заново.
+        
+        Возвращает:
+            dict: Агрегаты по названию; агрегат пропускается,
+                  если в данных нет нужных колонок
+        """
+        df = self.df
+        columns = set(df.columns)
+        aggregates = {}
+        
+        # Частоты цветов по убыванию: подсчет по целочисленным кодам
+        # категорий через np.bincount вместо хеширования строк
+        if 'Color' in columns:
+            color = df['Color']
+            codes = color.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(color.cat.categories))
+            order = np.argsort(-counts, kind='stable')
+            order = order[counts[order] > 0]  # Убираем цвета, которых нет в данных
+            aggregates['color_counts'] = pd.Series(counts[order], index=color.cat.categories[order])
+        
+        # Средняя цена по брендам
+        if {'Brand', 'Price(USD)'} <= columns:
+            aggregates['brand_price'] = df.groupby('Brand', observed=True, sort=False)['Price(USD)'] \
+                                          .mean() \
+                                          .sort_values()
+        
+        # Пять квантилей популярности по стилям для boxplot
+        # (минимум, квартили, медиана, максимум) за один проход
+        if {'Style', 'Popularity_Score'} <= columns:
+            aggregates['style_quartiles'] = _group_quantiles(
+                df['Style'], df['Popularity_Score'], QUARTILES
+            )
+        
+        # Средний рейтинг покупателей по сезонам. Сезоны вида
+        # "Winter 2023" по алфавиту идут в хронологическом порядке,
+        # поэтому сортируется только готовый результат по названию
+        if {'Season', 'Customer_Rating'} <= columns:
+            season_rating = df.groupby('Season', observed=True, sort=False)['Customer_Rating'] \
+                              .mean()
+            order = np.argsort(season_rating.index.astype(str))
+            aggregates['season_rating'] = season_rating.iloc[order]
+        
+        return aggregates
     
-    def plot_all_charts(self):
+    def plot_all_charts(self, save_path=None):
         """
         Построение 4 визуализаций для анализа данных.
-        Создает единое окно с 4 графиками.
+        Создает единую фигуру с 4 графиками.
+        
+        Аргументы:
+            save_path (str): Путь для сохранения фигуры в файл;
+                             после сохранения фигура закрывается
+        
+        Возвращает:
+            matplotlib.figure.Figure: Построенная фигура
         """
+        # Библиотеки для графиков импортируются только здесь:
+        # загрузка данных и текстовая статистика их не требуют
+        import matplotlib
+        
+        # На Linux без дисплея (CI, сервер) используем неинтерактивный
+        # бэкенд Agg, чтобы не загружать Tk/Qt. Бэкенд, заданный через
+        # MPLBACKEND или выбранный вызывающим кодом до импорта pyplot,
+        # не переопределяем: смена бэкенда закрыла бы открытые фигуры
+        if sys.platform.startswith('linux') and 'matplotlib.pyplot' not in sys.modules \
+                and 'MPLBACKEND' not in os.environ \
+                and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+            matplotlib.use('Agg')
+        
+        import matplotlib.pyplot as plt  # Для построения графиков
+        import seaborn as sns            # Для статистической визуализации
+        
         # Устанавливаем тему для графиков (белый фон с сеткой)
         sns.set_theme(style="whitegrid")
         
         # Создаем фигуру с 4 подграфиками (2 строки, 2 столбца)
         fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+        ax_colors, ax_prices, ax_styles, ax_seasons = axes.ravel()
         
         # Добавляем общий заголовок для всех графиков
         fig.suptitle('Комплексный анализ зимних модных трендов (2023-2025)', 
                     fontsize=20, fontweight='bold')
         
+        # Считаем все агрегаты заранее
+        aggregates = self._plot_aggregates()
+        
         #ГРАФИК 1: Самые трендовые цвета
         try:
-            # Строим столбчатую диаграмму для колонки 'Color'
-            sns.countplot(
-                ax=axes[0, 0],        # Размещаем на первом графике
-                data=self.df,          # Используем наш DataFrame
-                x='Color',             # Данные для оси X
-                order=self.df['Color'].value_counts().index,  # Сортируем по частоте
-                palette='muted',       # Используем приглушенную палитру
-                hue='Color',           # Группируем по цвету
-                legend=False           # Скрываем легенду
+            color_counts = aggregates['color_counts']
+
+            # Строим столбчатую диаграмму по готовым частотам
+            ax_colors.bar(
+                color_counts.index.astype(str),  # Цвета по оси X (в порядке частоты)
+                color_counts.values,             # Количество по оси Y
+                color=sns.color_palette('muted', len(color_counts))  # Приглушенная палитра
             )
-            axes[0, 0].set_title('Самые трендовые цвета', fontsize=14, fontweight='bold')
-            axes[0, 0].tick_params(axis='x', rotation=45)  # Поворачиваем подписи оси X
-            axes[0, 0].set_xlabel('Цвет', fontsize=12)
-            axes[0, 0].set_ylabel('Количество', fontsize=12)
+            ax_colors.set_title('Самые трендовые цвета', fontsize=14, fontweight='bold')
+            ax_colors.tick_params(axis='x', rotation=45)  # Поворачиваем подписи оси X
+            ax_colors.set_xlabel('Цвет', fontsize=12)
+            ax_colors.set_ylabel('Количество', fontsize=12)
         except Exception as e:
             logging.warning(f"Не удалось построить график цветов: {e}")
         
         # ГРАФИК 2: Средняя цена по брендам
         try:
-            # Группируем данные по брендам и вычисляем среднюю цену
-            brand_price = self.df.groupby('Brand')['Price(USD)'].mean().sort_values()
+            brand_price = aggregates['brand_price']
             
             # Строим горизонтальную столбчатую диаграмму
-            brand_price.plot(
-                kind='barh',          # Горизонтальные столбцы
-                ax=axes[0, 1],        # Размещаем на втором графике
+            ax_prices.barh(
+                brand_price.index.astype(str),  # Бренды по оси Y
+                brand_price.values,   # Средняя цена по оси X
                 color='skyblue',      # Задаем цвет
                 edgecolor='darkblue'  # Цвет границ столбцов
             )
-            axes[0, 1].set_title('Средняя цена по брендам (USD)', fontsize=14, fontweight='bold')
-            axes[0, 1].set_xlabel('Средняя цена, USD', fontsize=12)
-            axes[0, 1].set_ylabel('Бренд', fontsize=12)
+            ax_prices.set_title('Средняя цена по брендам (USD)', fontsize=14, fontweight='bold')
+            ax_prices.set_xlabel('Средняя цена, USD', fontsize=12)
+            ax_prices.set_ylabel('Бренд', fontsize=12)
         except Exception as e:
             logging.warning(f"Не удалось построить график цен: {e}")
         
         # ГРАФИК 3: Разброс популярности по стилям
         try:
+            style_quartiles = aggregates['style_quartiles']
+            
+            # Описание "ящиков" по готовым квантилям: усы - от минимума до максимума
+            stats = [
+                {
+                    'label': str(style),
+                    'whislo': row[0],
+                    'q1': row[0.25],
+                    'med': row[0.5],
+                    'q3': row[0.75],
+                    'whishi': row[1],
+                    'fliers': []
+                }
+                for style, row in style_quartiles.iterrows()
+            ]
+            
             # Строим boxplot (ящик с усами) для анализа распределения
-            sns.boxplot(
-                ax=axes[1, 0],        # Размещаем на третьем графике
-                data=self.df,
-                x='Style',            # Категории по оси X
-                y='Popularity_Score', # Значения по оси Y
-                palette='Set2',       # Используем палитру Set2
-                hue='Style',          # Группируем по стилю
-                legend=False          # Скрываем легенду
+            boxes = ax_styles.bxp(
+                stats,
+                showfliers=False,     # Выбросы не рассчитываются
+                patch_artist=True     # Ящики с заливкой
             )
-            axes[1, 0].set_title('Разброс популярности в зависимости от стиля', 
-                               fontsize=14, fontweight='bold')
-            axes[1, 0].set_xlabel('Стиль', fontsize=12)
-            axes[1, 0].set_ylabel('Оценка популярности', fontsize=12)
+            
+            # Раскрашиваем ящики палитрой Set2
+            for box, color in zip(boxes['boxes'], sns.color_palette('Set2', len(stats))):
+                box.set_facecolor(color)
+            ax_styles.set_title('Разброс популярности в зависимости от стиля', 
+                                fontsize=14, fontweight='bold')
+            ax_styles.set_xlabel('Стиль', fontsize=12)
+            ax_styles.set_ylabel('Оценка популярности', fontsize=12)
         except Exception as e:
             logging.warning(f"Не удалось построить boxplot популярности: {e}")
         
         # ===== ГРАФИК 4: Динамика рейтинга по сезонам =====
         try:
-            # Строим линейный график для отслеживания изменений
-            sns.lineplot(
-                ax=axes[1, 1],        # Размещаем на четвертом графике
-                data=self.df,
-                x='Season',           # Ось X: сезоны
-                y='Customer_Rating',  # Ось Y: рейтинг покупателей
+            season_rating = aggregates['season_rating']
+            
+            # Строим линейный график по готовым средним значениям
+            ax_seasons.plot(
+                season_rating.index.astype(str),  # Ось X: сезоны
+                season_rating.values,  # Ось Y: средний рейтинг покупателей
                 marker='o',           # Добавляем маркеры в точках данных
                 color='red',          # Цвет линии
                 linewidth=2.5,        # Толщина линии
                 markersize=8          # Размер маркеров
             )
-            axes[1, 1].set_title('Динамика рейтинга покупателей по сезонам', 
-                               fontsize=14, fontweight='bold')
-            axes[1, 1].set_xlabel('Сезон', fontsize=12)
-            axes[1, 1].set_ylabel('Средний рейтинг', fontsize=12)
+            ax_seasons.set_title('Динамика рейтинга покупателей по сезонам', 
+                                 fontsize=14, fontweight='bold')
+            ax_seasons.set_xlabel('Сезон', fontsize=12)
+            ax_seasons.set_ylabel('Средний рейтинг', fontsize=12)
             
             # Добавляем сетку для лучшей читаемости
-            axes[1, 1].grid(True, alpha=0.3)
+            ax_seasons.grid(True, alpha=0.3)
         except Exception as e:
             logging.warning(f"Не удалось построить график рейтинга: {e}")
         
+        # Столбцы и ящики растрируются при сохранении в векторные
+        # форматы (PDF, SVG), чтобы не хранить каждую фигуру отдельно
+        for ax in (ax_colors, ax_prices, ax_styles):
+            for artist in [*ax.patches, *ax.collections]:
+                artist.set_rasterized(True)
+        
         # Автоматически подгоняем расположение графиков
         plt.tight_layout(rect=[0, 0.03, 1, 0.95])
         
-        # Показываем все графики
-        plt.show()
+        # Сохраняем фигуру в файл, если указан путь
+        if save_path:
+            fig.savefig(save_path, dpi=100)
+            plt.close(fig)
+            logging.info(f"Графики сохранены в {save_path}.")
+        
+        return fig
     
-    def run(self):
+    def run(self, plot=True, save_path=None):
         """
         Основной метод для запуска полного анализа.
         Выполняет все шаги последовательно.
+        
+        Аргументы:
+            plot (bool): Строить ли графики (False - только текстовая статистика)
+            save_path (str): Путь для сохранения графиков в файл
         """
         # 1. Загружаем данные
         if self.load_data():
@@ -190,7 +542,18 @@ class FashionAnalyzer:
             self.print_text_stats()
             
             # 3. Строим графики
-            self.plot_all_charts()
+            if plot:
+                self.plot_all_charts(save_path)
+                
+                # Показываем окно с графиками, если они не были сохранены
+                # в файл (сохраненная фигура уже закрыта)
+                if not save_path:
+                    import matplotlib.pyplot as plt
+                    if plt.get_backend().lower() == 'agg':
+                        logging.warning("Нет дисплея для показа графиков: "
+                                        "укажите save_path, чтобы сохранить их в файл.")
+                    else:
+                        plt.show()
             
             # 4. Сообщаем об успешном завершении
             logging.info("Анализ завершен успешно!")